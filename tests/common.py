@@ -1,13 +1,34 @@
 import datetime as dt
+import os
+from functools import lru_cache
+
+from dateutil.tz import tzical
 
 TEST_FILE_DIR = "tests/test_files"
 
 two_hours = dt.timedelta(hours=2)
 
+_test_files: dict[str, str] = {}
+
+
+def preload_test_files():
+    """Read every test file in a single directory scan, see `get_test_file`."""
+    with os.scandir(TEST_FILE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name not in _test_files:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    _test_files[entry.name] = f.read()
+
 
 def get_test_file(file_name: str) -> str:
-    """Helper function to open and read test files."""
-    filepath = f"{TEST_FILE_DIR}/{file_name}"
-    with open(filepath, "r", encoding="utf-8") as f:
-        text = f.read()
-    return text
+    """Helper function to open and read test files, each file is read from disk only once."""
+    if file_name not in _test_files:
+        with open(f"{TEST_FILE_DIR}/{file_name}", "r", encoding="utf-8") as f:
+            _test_files[file_name] = f.read()
+    return _test_files[file_name]
+
+
+@lru_cache(maxsize=None)
+def get_tzical() -> tzical:
+    """Timezones of `timezones.ics`, parsed once and shared by all tests."""
+    return tzical(f"{TEST_FILE_DIR}/timezones.ics")
@@ -0,0 +1,26 @@
+import pytest
+
+from vobject import read_one
+
+from .common import get_test_file, preload_test_files
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_test_files():
+    preload_test_files()
+
+
+@pytest.fixture(scope="session")
+def class_setup():
+    return {
+        "vcard_file": get_test_file("vcard_with_groups.ics"),
+        "simple_test_cal": get_test_file("simple_test.ics"),
+        "vtodo_file": get_test_file("vtodo.ics"),
+    }
+
+
+# pylint:disable = W0621
+@pytest.fixture(scope="session")
+def parsed_vcard(class_setup):
+    """`vcard_file` parsed once, tests that mutate it must work on a copy."""
+    return read_one(class_setup["vcard_file"])
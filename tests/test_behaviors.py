@@ -1,30 +1,34 @@
 import datetime as dt
 
+import pytest
+
 from vobject.base import ContentLine
 from vobject.base import __behavior_registry as behavior_registry
-from vobject.base import get_behavior, text_line_to_content_line
-from vobject.icalendar import MultiDateBehavior, PeriodBehavior
+from vobject.base import get_behavior, register_behavior, text_line_to_content_line
+from vobject.icalendar import DateTimeBehavior, MultiDateBehavior, PeriodBehavior, TextBehavior, VCalendar2
 
 from .common import two_hours
 
+# fmt: off
+EXPECTED_BEHAVIOR_KEYS = frozenset({
+    "", "ACTION", "ADR", "AVAILABLE", "BUSYTYPE", "CALSCALE", "CATEGORIES", "CLASS", "COMMENT", "COMPLETED",
+    "CONTACT", "CREATED", "DAYLIGHT", "DESCRIPTION", "DTEND", "DTSTAMP", "DTSTART", "DUE", "DURATION", "EXDATE",
+    "EXRULE", "FN", "FREEBUSY", "GEO", "LABEL", "LAST-MODIFIED", "LOCATION", "METHOD", "N", "ORG", "PHOTO",
+    "PRODID", "RDATE", "RECURRENCE-ID", "RELATED-TO", "REQUEST-STATUS", "RESOURCES", "RRULE", "STANDARD",
+    "STATUS", "SUMMARY", "TRANSP", "TRIGGER", "UID", "VALARM", "VAVAILABILITY", "VCALENDAR", "VCARD", "VEVENT",
+    "VFREEBUSY", "VJOURNAL", "VTIMEZONE", "VTODO",
+})
+# fmt: on
+
 
 def test_general_behavior():
     """Tests for behavior registry, getting and creating a behavior."""
     # Check expected behavior registry
-    # fmt: off
-    assert sorted(behavior_registry.keys()) == [
-        "", "ACTION", "ADR", "AVAILABLE", "BUSYTYPE", "CALSCALE", "CATEGORIES", "CLASS", "COMMENT", "COMPLETED",
-        "CONTACT", "CREATED", "DAYLIGHT", "DESCRIPTION", "DTEND", "DTSTAMP", "DTSTART", "DUE", "DURATION", "EXDATE",
-        "EXRULE", "FN", "FREEBUSY", "GEO", "LABEL", "LAST-MODIFIED", "LOCATION", "METHOD", "N", "ORG", "PHOTO",
-        "PRODID", "RDATE", "RECURRENCE-ID", "RELATED-TO", "REQUEST-STATUS", "RESOURCES", "RRULE", "STANDARD",
-        "STATUS", "SUMMARY", "TRANSP", "TRIGGER", "UID", "VALARM", "VAVAILABILITY", "VCALENDAR", "VCARD", "VEVENT",
-        "VFREEBUSY", "VJOURNAL", "VTIMEZONE", "VTODO",
-    ]
-    # fmt: on
+    assert frozenset(behavior_registry) == EXPECTED_BEHAVIOR_KEYS
 
     # test get_behavior
     behavior = get_behavior("VCALENDAR")
-    assert str(behavior) == "<class 'vobject.icalendar.VCalendar2'>"
+    assert behavior is VCalendar2
     assert behavior.is_component
     assert get_behavior("invalid_name") is None
 
@@ -33,22 +37,70 @@ def test_general_behavior():
     assert not non_component_behavior.is_component
 
 
-def test_multi_date_behavior():
-    """Test MultiDateBehavior"""
-    parse_rdate = MultiDateBehavior.transform_to_native
-    assert str(parse_rdate(text_line_to_content_line("RDATE;VALUE=DATE:19970304,19970504,19970704,19970904"))) == (
+def test_has_encoding():
+    """Only behaviors overriding encode or decode need the serialize round trip"""
+    assert TextBehavior.has_encoding
+    assert not DateTimeBehavior.has_encoding
+
+    class DecodeOnly(DateTimeBehavior):
+        @classmethod
+        def decode(cls, line):
+            pass
+
+    assert DecodeOnly.has_encoding
+
+    class StaticEncode(DateTimeBehavior):
+        @staticmethod
+        def encode(line):
+            pass
+
+    assert StaticEncode.has_encoding
+
+    def plain_decode(line):
+        pass
+
+    class FunctionDecode(DateTimeBehavior):
+        decode = plain_decode
+
+    assert FunctionDecode.has_encoding
+
+
+def test_register_behavior_clears_lookup_cache():
+    """A lookup cached before registration must not hide the new behavior."""
+    assert get_behavior("VCALENDAR", "9.9") is VCalendar2
+
+    class VCalendar9(VCalendar2):
+        version_string = "9.9"
+
+    register_behavior(VCalendar9)
+    try:
+        assert get_behavior("VCALENDAR", "9.9") is VCalendar9
+        assert get_behavior("VCALENDAR") is VCalendar2
+    finally:
+        del behavior_registry["VCALENDAR"]["9.9"]
+        get_behavior.cache_clear()
+
+
+MULTI_DATE_CASES = (
+    (
+        "RDATE;VALUE=DATE:19970304,19970504,19970704,19970904",
         "<RDATE{'VALUE': ['DATE']}[datetime.date(1997, 3, 4), datetime.date(1997, 5, 4), "
-        "datetime.date(1997, 7, 4), datetime.date(1997, 9, 4)]>"
-    )
-    assert str(
-        parse_rdate(
-            text_line_to_content_line("RDATE;VALUE=PERIOD:19960403T020000Z/19960403T040000Z,19960404T010000Z/PT3H")
-        )
-    ) == (
+        "datetime.date(1997, 7, 4), datetime.date(1997, 9, 4)]>",
+    ),
+    (
+        "RDATE;VALUE=PERIOD:19960403T020000Z/19960403T040000Z,19960404T010000Z/PT3H",
         "<RDATE{'VALUE': ['PERIOD']}[(datetime.datetime(1996, 4, 3, 2, 0, tzinfo=tzutc()), datetime.datetime"
         "(1996, 4, 3, 4, 0, tzinfo=tzutc())), (datetime.datetime(1996, 4, 4, 1, 0, tzinfo=tzutc()), "
-        + "datetime.timedelta(seconds=10800))]>"
-    )
+        "datetime.timedelta(seconds=10800))]>",
+    ),
+)
+
+
+@pytest.mark.parametrize("text,expected", MULTI_DATE_CASES)
+def test_multi_date_behavior(text, expected):
+    """Test MultiDateBehavior"""
+    # transform_to_native converts the line in place, so each run needs a fresh one
+    assert str(MultiDateBehavior.transform_to_native(text_line_to_content_line(text))) == expected
 
 
 def test_period_behavior():
@@ -1,24 +1,35 @@
 import datetime as dt
 import json
 
-import dateutil
 from dateutil.tz import tzutc
 
 from vobject import VERSION, iCalendar, new_from_behavior, read_one
 
-from .common import TEST_FILE_DIR, get_test_file
+from .common import get_test_file, get_tzical
+
+MULTILINE_DESCRIPTION = "Классное событие " * 5 + "Классsdssdное событие"
+
+
+def _roundtrip(file_name):
+    """Returns (parsed, reparsed) calendars of a test file"""
+    parsed = read_one(get_test_file(file_name))
+    return parsed, read_one(parsed.serialize())
+
+
+def _new_event_cal():
+    """Empty 2.0 calendar holding a single vevent"""
+    cal = iCalendar()
+    cal.add("vevent")
+    return cal
 
 
 def test_scratchbuild():
     """CreateCalendar 2.0 format from scratch"""
     test_cal = get_test_file("simple_2_0_test.ics") % VERSION
-    cal = new_from_behavior("vcalendar", "2.0")
-    cal.add("vevent")
+    cal = _new_event_cal()
     cal.vevent.add("dtstart").value = dt.datetime(2006, 5, 9)
     cal.vevent.add("description").value = "Test event"
-    cal.vevent.add("created").value = dt.datetime(
-        2006, 1, 1, 10, tzinfo=dateutil.tz.tzical(f"{TEST_FILE_DIR}/timezones.ics").get("US/Pacific")
-    )
+    cal.vevent.add("created").value = dt.datetime(2006, 1, 1, 10, tzinfo=get_tzical().get("US/Pacific"))
     cal.vevent.add("uid").value = "Not very random UID"
     cal.vevent.add("dtstamp").value = dt.datetime(2017, 6, 26, 0, tzinfo=tzutc())
 
@@ -26,27 +37,19 @@ def test_scratchbuild():
     cal.vevent.attendee.params["CN"] = ["Fröhlich"]
 
     # Note we're normalizing line endings, because no one got time for that.
-    assert cal.serialize().replace("\r\n", "\n") == test_cal.replace("\r\n", "\n")
+    assert cal.serialize() == test_cal.replace("\n", "\r\n")
 
 
 def test_unicode():
     """Test unicode characters"""
-
-    def common_checks(test_cal_):
-        vevent = read_one(test_cal_).vevent
-        vevent2 = read_one(vevent.serialize())
-        assert str(vevent) == str(vevent2)
-        assert vevent.summary.value == "The title こんにちはキティ"
-
-    test_cal = get_test_file("utf8_test.ics")
-    common_checks(test_cal)
+    cal, cal2 = _roundtrip("utf8_test.ics")
+    assert str(cal.vevent) == str(cal2.vevent)
+    assert cal.vevent.summary.value == "The title こんにちはキティ"
 
 
 def test_wrapping():
     """Should support input file with a long text field covering multiple lines"""
-    test_journal = get_test_file("journal.ics")
-    vobj = read_one(test_journal)
-    vjournal = read_one(vobj.serialize())
+    _, vjournal = _roundtrip("journal.ics")
     assert "Joe, Lisa, and Bob" in vjournal.description.value
     assert "Tuesday.\n2." in vjournal.description.value
 
@@ -70,17 +73,15 @@ def test_semicolon_separated():
 
 def test_unicode_multiline():
     """Test multiline unicode characters"""
-    cal = iCalendar()
+    cal = _new_event_cal()
     cal.add("method").value = "REQUEST"
-    cal.add("vevent")
     cal.vevent.add("created").value = dt.datetime.now()
     cal.vevent.add("summary").value = "Классное событие"
-    cal.vevent.add("description").value = (
-        "Классное событие Классное событие Классное событие Классное событие Классное событие Классsdssdное событие"
-    )
+    cal.vevent.add("description").value = MULTILINE_DESCRIPTION
 
     # json tries to encode as utf-8 and it would break if some chars could not be encoded
-    json.dumps(cal.serialize())
+    serialized = cal.serialize()
+    assert json.loads(json.dumps(serialized, ensure_ascii=False).encode("utf-8")) == serialized
 
 
 def test_ical_to_hcal():
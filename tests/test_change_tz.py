@@ -1,76 +1,66 @@
 import datetime as dt
-from dataclasses import dataclass
 
 from dateutil.tz import gettz
 
 from vobject.change_tz import change_tz
 
+UTC = gettz("UTC")  # 0:00
+CHICAGO = gettz("America/Chicago")  # -5:00
+SANTIAGO = gettz("America/Santiago")  # -4:00
 
-@dataclass
-class Node:
-    value: str
+# (dtstart, dtend) pairs, datetimes are immutable so tests can share them
+UTC_DATES = (
+    (dt.datetime(1999, 12, 31, 23, 59, 59, tzinfo=UTC), dt.datetime(2000, 1, 1, tzinfo=UTC)),
+    (dt.datetime(2010, 12, 31, 23, 59, 59, tzinfo=UTC), dt.datetime(2011, 1, 2, 3, tzinfo=UTC)),
+)
+UTC_DATES_IN_CHICAGO = (
+    (dt.datetime(1999, 12, 31, 17, 59, 59, tzinfo=CHICAGO), dt.datetime(1999, 12, 31, 18, tzinfo=CHICAGO)),
+    (dt.datetime(2010, 12, 31, 17, 59, 59, tzinfo=CHICAGO), dt.datetime(2011, 1, 1, 21, tzinfo=CHICAGO)),
+)
+MIXED_DATES = ((UTC_DATES[0][0], dt.datetime(2000, 1, 1, tzinfo=SANTIAGO)),)
+NAIVE_DATES = ((dt.datetime(1999, 12, 31, 23, 59, 59), dt.datetime(2000, 1, 1)),)
+
+
+class Node:  # pylint:disable=R0903
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
 
 
 class StubEvent:  # pylint:disable=R0903
+    __slots__ = ("dtstart", "dtend")
+
     def __init__(self, dtstart, dtend):
         self.dtstart = Node(dtstart)
         self.dtend = Node(dtend)
 
 
 class StubCal:  # pylint:disable=R0903
+    __slots__ = ("vevent_list",)
+
     def __init__(self, dates):
         """dates is a list of tuples (dtstart, dtend)"""
         self.vevent_list = [StubEvent(*d) for d in dates]
 
 
-def test_change_tz():
-    """Change the timezones of events in a component to a different timezone"""
-    # Setup - create a stub vevent list
-    old_tz = gettz("UTC")  # 0:00
-    new_tz = gettz("America/Chicago")  # -5:00
-
-    dates = [
-        (dt.datetime(1999, 12, 31, 23, 59, 59, tzinfo=old_tz), dt.datetime(2000, 1, 1, tzinfo=old_tz)),
-        (dt.datetime(2010, 12, 31, 23, 59, 59, tzinfo=old_tz), dt.datetime(2011, 1, 2, 3, tzinfo=old_tz)),
-    ]
-
-    cal = StubCal(dates)
+def assert_dates(cal, expected_dates):
+    assert [(vevent.dtstart.value, vevent.dtend.value) for vevent in cal.vevent_list] == list(expected_dates)
 
-    # Exercise - change the timezone
-    change_tz(cal, new_tz, gettz("UTC"))
 
-    # Test - that the tzs were converted correctly
-    expected_new_dates = [
-        (dt.datetime(1999, 12, 31, 17, 59, 59, tzinfo=new_tz), dt.datetime(1999, 12, 31, 18, tzinfo=new_tz)),
-        (dt.datetime(2010, 12, 31, 17, 59, 59, tzinfo=new_tz), dt.datetime(2011, 1, 1, 21, tzinfo=new_tz)),
-    ]
-
-    for vevent, expected_datepair in zip(cal.vevent_list, expected_new_dates):
-        assert vevent.dtstart.value == expected_datepair[0]
-        assert vevent.dtend.value == expected_datepair[1]
+def test_change_tz():
+    """Change the timezones of events in a component to a different timezone"""
+    cal = StubCal(UTC_DATES)
+    change_tz(cal, CHICAGO, UTC)
+    assert_dates(cal, UTC_DATES_IN_CHICAGO)
 
 
 def test_change_tz_utc_only():
     """Change any UTC timezones of events in a component to a different timezone"""
-
-    # Setup - create a stub vevent list
-    utc_tz = gettz("UTC")  # 0:00
-    non_utc_tz = gettz("America/Santiago")  # -4:00
-    new_tz = gettz("America/Chicago")  # -5:00
-
-    dates = [(dt.datetime(1999, 12, 31, 23, 59, 59, tzinfo=utc_tz), dt.datetime(2000, 1, 1, tzinfo=non_utc_tz))]
-
-    cal = StubCal(dates)
-
-    # Exercise - change the timezone passing utc_only=True
-    change_tz(cal, new_tz, gettz("UTC"), utc_only=True)
-
-    # Test - that only the utc item has changed
-    expected_new_dates = [(dt.datetime(1999, 12, 31, 17, 59, 59, tzinfo=new_tz), dates[0][1])]
-
-    for vevent, expected_datepair in zip(cal.vevent_list, expected_new_dates):
-        assert vevent.dtstart.value == expected_datepair[0]
-        assert vevent.dtend.value == expected_datepair[1]
+    cal = StubCal(MIXED_DATES)
+    change_tz(cal, CHICAGO, UTC, utc_only=True)
+    # only the utc item has changed
+    assert_dates(cal, [(UTC_DATES_IN_CHICAGO[0][0], MIXED_DATES[0][1])])
 
 
 def test_change_tz_default():
@@ -78,22 +68,6 @@ def test_change_tz_default():
     Change the timezones of events in a component to a different timezone, passing a default timezone that is
     assumed when the events don't have one
     """
-
-    # Setup - create a stub vevent list
-    new_tz = gettz("America/Chicago")  # -5:00
-
-    dates = [(dt.datetime(1999, 12, 31, 23, 59, 59, tzinfo=None), dt.datetime(2000, 1, 1, tzinfo=None))]
-
-    cal = StubCal(dates)
-
-    # Exercise - change the timezone
-    change_tz(cal, new_tz, gettz("UTC"))
-
-    # Test - that the tzs were converted correctly
-    expected_new_dates = [
-        (dt.datetime(1999, 12, 31, 17, 59, 59, tzinfo=new_tz), dt.datetime(1999, 12, 31, 18, tzinfo=new_tz))
-    ]
-
-    for vevent, expected_datepair in zip(cal.vevent_list, expected_new_dates):
-        assert vevent.dtstart.value == expected_datepair[0]
-        assert vevent.dtend.value == expected_datepair[1]
+    cal = StubCal(NAIVE_DATES)
+    change_tz(cal, CHICAGO, UTC)
+    assert_dates(cal, UTC_DATES_IN_CHICAGO[:1])
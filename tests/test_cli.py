@@ -1,15 +1,33 @@
-import subprocess
+import importlib
+import sys
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
+from io import StringIO
+from types import SimpleNamespace
 
 
 @dataclass
 class Cli:
-    ics_diff = "ics_diff"
-    change_tz = "change_tz"
-
-
-def run_cli_tool(toolname: str, args: list[str]):
-    return subprocess.run([toolname] + args, capture_output=True, text=True, check=False)
+    ics_diff = "vobject.ics_diff"
+    change_tz = "vobject.change_tz"
+
+
+def run_cli_tool(module_name: str, args: list[str]):
+    """Run the `main()` of a cli module in-process, returning a subprocess-like result."""
+    module = importlib.import_module(module_name)
+    stdout, stderr = StringIO(), StringIO()
+    argv = sys.argv
+    sys.argv = [module_name.rsplit(".", 1)[-1]] + args
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                module.main()
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code or 0
+    finally:
+        sys.argv = argv
+    return SimpleNamespace(returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue())
 
 
 def test_change_tz():
@@ -8,23 +8,41 @@ import vobject as vo
 
 from .common import get_test_file
 
+GET_LOGICAL_LINES_INPUT = (
+    "Line 0 text\n , Line 0 continued.\n"
+    "Line 1;encoding=quoted-printable:this is an evil=\n evil=\n format.\n"
+    "Line 2 is a new line, it does not start with whitespace."
+)
 
-def test_get_logical_lines():
+
+@pytest.mark.parametrize("make_input", [StringIO, lambda text: text.splitlines(keepends=True)], ids=["stream", "lines"])
+def test_get_logical_lines(make_input):
     """Converted from doctest of vobject/base.py"""
-    test_lines = (
-        "Line 0 text\n , Line 0 continued.\n"
-        "Line 1;encoding=quoted-printable:this is an evil=\n evil=\n format.\n"
-        "Line 2 is a new line, it does not start with whitespace."
-    )
+    fp = make_input(GET_LOGICAL_LINES_INPUT)
     expected = [
         "Line 0 text, Line 0 continued.",
         "Line 1;encoding=quoted-printable:this is an evil=\n evil=\n format.",
         "Line 2 is a new line, it does not start with whitespace.",
     ]
-    result = [line for line, _ in vo.base.get_logical_lines(StringIO(test_lines))]
+    result = [line for line, _ in vo.base.get_logical_lines(fp)]
     assert result == expected
 
 
+@pytest.mark.parametrize("allow_qp", [True, False], ids=["qp", "no_qp"])
+def test_get_logical_lines_inputs(allow_qp):
+    """Strings and lines without endings are split like a stream"""
+    expected = list(vo.base.get_logical_lines(StringIO("A:1\r\nB:2\r\n c"), allow_qp=allow_qp))
+    assert [line for line, _ in expected] == ["A:1", "B:2c"]
+    assert list(vo.base.get_logical_lines("A:1\r\nB:2\r\n c", allow_qp=allow_qp)) == expected
+    assert list(vo.base.get_logical_lines(["A:1", "B:2", " c"], allow_qp=allow_qp)) == expected
+
+
+def test_get_logical_lines_numbers():
+    """Logical lines report the physical line they start on"""
+    result = list(vo.base.get_logical_lines(StringIO("A\r\n B\r\n\r\nC\r\n\tD\r\nE"), allow_qp=False))
+    assert result == [("AB", 1), ("CD", 4), ("E", 6)]
+
+
 def test_vobject():
     """Converted from doctest of vobject/__init__.py"""
     x = vo.iCalendar()
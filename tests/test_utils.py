@@ -1,7 +1,8 @@
 import datetime as dt
 from io import StringIO
 
-from dateutil.tz import tzutc
+import pytest
+from dateutil.tz import gettz, tzutc
 
 from vobject.base import fold_one_line
 from vobject.helper import indent_str
@@ -9,9 +10,9 @@ from vobject.icalendar import date_to_string, datetime_to_string
 from vobject.vcard import to_list
 
 
-def test_to_list():
-    assert to_list("") == [""]
-    assert to_list("Knudson") == ["Knudson"]
+@pytest.mark.parametrize("value,expected", [("", [""]), ("Knudson", ["Knudson"])])
+def test_to_list(value, expected):
+    assert to_list(value) == expected
 
 
 def test_indent_str():
@@ -19,19 +20,38 @@ def test_indent_str():
     assert indent_str(level=1, tabwidth=4) == " " * 4
 
 
-def test_date_to_string():
-    tc = {dt.date(2007, 5, 1): "20070501", dt.date(1997, 3, 17): "19970317"}
-    for _date, out in tc.items():
-        assert date_to_string(_date) == out
+@pytest.mark.parametrize(
+    "date,expected",
+    [(dt.date(2007, 5, 1), "20070501"), (dt.date(1997, 3, 17), "19970317"), (dt.date(999, 1, 2), "09990102")],
+)
+def test_date_to_string(date, expected):
+    assert date_to_string(date) == expected
 
 
-def test_datetime_to_string():
-    tc = {
-        (dt.datetime(2000, 10, 29, 3, 0), False): "20001029T030000",
-        (dt.datetime(2007, 3, 13, 12, 34, 32, tzinfo=tzutc()), True): "20070313T123432Z",
-    }
-    for inp, out in tc.items():
-        assert datetime_to_string(*inp) == out
+def test_date_to_string_same_instant():
+    """Equal (same instant) datetimes can fall on different local dates"""
+    local = dt.datetime(2024, 3, 5, 23, tzinfo=gettz("America/New_York"))
+    assert date_to_string(local) == "20240305"
+    assert date_to_string(local.astimezone(tzutc())) == "20240306"
+
+
+def test_datetime_to_string_same_instant():
+    """Equal (same instant) datetimes in different zones must keep their own representation"""
+    local = dt.datetime(2024, 3, 5, 10, tzinfo=gettz("America/New_York"))
+    assert datetime_to_string(local) == "20240305T100000"
+    assert datetime_to_string(local.astimezone(tzutc())) == "20240305T150000Z"
+
+
+@pytest.mark.parametrize(
+    "datetime,convert_to_utc,expected",
+    [
+        (dt.datetime(2000, 10, 29, 3, 0), False, "20001029T030000"),
+        (dt.datetime(2007, 3, 13, 12, 34, 32, tzinfo=tzutc()), True, "20070313T123432Z"),
+        (dt.datetime(5, 1, 2, 3, 4, 5), False, "00050102T030405"),
+    ],
+)
+def test_datetime_to_string(datetime, convert_to_utc, expected):
+    assert datetime_to_string(datetime, convert_to_utc) == expected
 
 
 def test_fold_one_line():
@@ -45,4 +65,28 @@ def test_fold_one_line():
     )
     buf = StringIO()
     fold_one_line(buf, test_input)
+    folded = buf.getvalue()
+    assert len(folded) == len(expected)
+    assert folded == expected
+
+
+def test_fold_one_line_ascii():
+    test_input = "SUMMARY:" + "0123456789" * 15
+    expected = (
+        "SUMMARY:0123456789012345678901234567890123456789012345678901234567890123456\r\n"
+        " 78901234567890123456789012345678901234567890123456789012345678901234567890\r\n"
+        " 123456789\r\n"
+    )
+    buf = StringIO()
+    fold_one_line(buf, test_input)
     assert buf.getvalue() == expected
+
+
+@pytest.mark.parametrize("length,expected_lines", ((75, 1), (76, 2)))
+def test_fold_one_line_boundary(length, expected_lines):
+    test_input = "SUMMARY:" + "x" * (length - 8)
+    buf = StringIO()
+    fold_one_line(buf, test_input)
+    folded = buf.getvalue()
+    assert folded.count("\r\n") == expected_lines
+    assert folded.replace("\r\n ", "") == test_input + "\r\n"
@@ -6,15 +6,20 @@ import pytest
 from dateutil.tz import tzutc
 
 from vobject import read_components, read_one
-from vobject.base import ParseError, parse_params
+from vobject.base import ParseError, VObjectError, dquote_escape, parse_params
 
 from .common import get_test_file
 
+SILLY_TEST = get_test_file("silly_test.ics")
+STANDARD_TEST = get_test_file("standard_test.ics")
+BAD_STREAM = get_test_file("badstream.ics")
+BAD_LINE = get_test_file("badline.ics")
+QUOTED_PRINTABLE = get_test_file("quoted-printable.ics")
+
 
 def test_read_one():
     """Test reading first component of ics"""
-    cal = get_test_file("silly_test.ics")
-    silly = read_one(cal)
+    silly = read_one(SILLY_TEST)
     assert str(silly) == (
         "<SILLYPROFILE| [<MORESTUFF{}this line is not folded, but in practice probably ought to be, as it is"
         " exceptionally long, and moreover demonstratively stupid>, <SILLYNAME{}name>, <STUFF{}foldedline>]>"
@@ -22,10 +27,14 @@ def test_read_one():
     assert str(silly.stuff) == "<STUFF{}foldedline>"
 
 
+def test_read_one_bytes():
+    """Test reading UTF-8 encoded bytes"""
+    assert str(read_one(SILLY_TEST.encode("utf-8"))) == str(read_one(SILLY_TEST))
+
+
 def test_importing():
     """Test importing ics"""
-    cal = get_test_file("standard_test.ics")
-    c = read_one(cal, validate=True)
+    c = read_one(STANDARD_TEST, validate=True)
     assert str(c.vevent.valarm.trigger) == "<TRIGGER{}-1 day, 0:00:00>"
 
     assert str(c.vevent.dtstart.value) == "2002-10-28 14:00:00-08:00"
@@ -40,34 +49,55 @@ def test_importing():
 
 def test_bad_stream():
     """Test bad ics stream"""
-    cal = get_test_file("badstream.ics")
     with pytest.raises(ParseError):
-        read_one(cal)
+        read_one(BAD_STREAM)
 
 
 def test_bad_line():
     """Test bad line in ics file"""
-    cal = get_test_file("badline.ics")
     with pytest.raises(ParseError):
-        read_one(cal)
+        read_one(BAD_LINE)
 
-    newcal = read_one(cal, ignore_unreadable=True)
+    newcal = read_one(BAD_LINE, ignore_unreadable=True)
     assert str(newcal.vevent.x_bad_underscore) == "<X-BAD-UNDERSCORE{}TRUE>"
 
 
-def test_parse_params():
+PARSE_PARAMS_CASES = (
+    (';ALTREP="http://www.wiz.org"', [["ALTREP", "http://www.wiz.org"]]),
+    (
+        ';ALTREP="http://www.wiz.org;;",Blah,Foo;NEXT=Nope;BAR',
+        [["ALTREP", "http://www.wiz.org;;", "Blah", "Foo"], ["NEXT", "Nope"], ["BAR"]],
+    ),
+)
+
+
+@pytest.mark.parametrize("string,expected", PARSE_PARAMS_CASES)
+def test_parse_params(string, expected):
     """Test parsing parameters"""
-    assert parse_params(';ALTREP="http://www.wiz.org"') == [["ALTREP", "http://www.wiz.org"]]
-    assert parse_params(';ALTREP="http://www.wiz.org;;",Blah,Foo;NEXT=Nope;BAR') == [
-        ["ALTREP", "http://www.wiz.org;;", "Blah", "Foo"],
-        ["NEXT", "Nope"],
-        ["BAR"],
-    ]
+    assert parse_params(string) == expected
+
+
+def test_parse_params_cached_copies():
+    """Parsed params are cached, results handed out must not share state"""
+    params = parse_params(";TYPE=WORK")
+    params[0].append("HOME")
+    assert parse_params(";TYPE=WORK") == [["TYPE", "WORK"]]
+
+
+@pytest.mark.parametrize(
+    "param,expected",
+    (("WORK", "WORK"), ("a,b", '"a,b"'), ("a;b", '"a;b"'), ("mailto:x@example.com", '"mailto:x@example.com"')),
+)
+def test_dquote_escape(param, expected):
+    assert dquote_escape(param) == expected
+
+
+def test_dquote_escape_error():
+    with pytest.raises(VObjectError):
+        dquote_escape('say "hi"')
 
 
 def test_quoted_printable():
     """The use of QUOTED-PRINTABLE encoding"""
-    ics_str = get_test_file("quoted-printable.ics")
-    vobjs = read_components(ics_str, allow_qp=True)
-    for vo in vobjs:
-        assert vo is not None
+    vobjs = read_components(QUOTED_PRINTABLE, allow_qp=True)
+    assert all(vo is not None for vo in vobjs)
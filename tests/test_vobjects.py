@@ -1,4 +1,6 @@
+import copy
 import datetime as dt
+import pickle
 
 import pytest
 
@@ -9,46 +11,68 @@ from vobject.exceptions import ParseError
 from .common import get_test_file
 
 
-# pylint:disable = W0621
-@pytest.fixture(scope="module")
-def class_setup():
-    return {
-        "vcard_file": get_test_file("vcard_with_groups.ics"),
-        "simple_test_cal": get_test_file("simple_test.ics"),
-        "vtodo_file": get_test_file("vtodo.ics"),
-    }
-
-
 def test_vcard_creation():
     vcard = new_from_behavior("vcard", "3.0")
     assert str(vcard) == "<VCARD| []>"
 
 
-def test_default_behavior(class_setup):
-    card = read_one(class_setup["vcard_file"])
+def test_default_behavior(parsed_vcard):
+    card = parsed_vcard
     assert get_behavior("note") is None
     expected = "The Mayor of the great city of Goerlitz in the great country of Germany.\nNext line."
     assert str(card.note.value) == expected
 
 
-def test_with_groups(class_setup):
-    card = read_one(class_setup["vcard_file"])
+def test_with_groups(parsed_vcard):
+    card = copy.deepcopy(parsed_vcard)
     assert str(card.group) == "home"
     assert str(card.tel.group) == "home"
 
     card.group = card.tel.group = "new"
-    assert str(card.tel.serialize().strip()) == "new.TEL;TYPE=fax,voice,msg:+49 3581 123456"
-    assert str(card.serialize().splitlines()[0]) == "new.BEGIN:VCARD"
+    assert card.tel.serialize() == "new.TEL;TYPE=fax,voice,msg:+49 3581 123456\r\n"
+    assert card.serialize().startswith("new.BEGIN:VCARD\r\n")
+
+
+def test_duplicate_is_independent(parsed_vcard):
+    tel = parsed_vcard.tel
+    tel_copy = tel.duplicate(tel)
+    assert tel_copy == tel
+
+    tel_copy.params["TYPE"].append("cell")
+    tel_copy.singletonparams.append("X-FLAG")
+    assert tel.params["TYPE"] == ["fax", "voice", "msg"]
+    assert not tel.singletonparams
+
+
+def test_param_attributes(parsed_vcard):
+    tel = parsed_vcard.tel
+    assert tel.type_param == "fax"
+    assert tel.type_paramlist == ["fax", "voice", "msg"]
+    with pytest.raises(AttributeError):
+        getattr(tel, "x_missing_param")
+    with pytest.raises(AttributeError):
+        getattr(tel, "x_missing_paramlist")
+
+
+def test_get_child_value():
+    event = new_from_behavior("vevent")
+    event.add("summary").value = "Meeting"
+    event.add("x-custom-prop").value = "custom"
+    assert event.get_child_value("summary") == "Meeting"
+    assert event.get_child_value("x_custom_prop") == "custom"
+    assert event.get_child_value("location") is None
+    assert event.get_child_value("location", "nowhere") == "nowhere"
 
 
 def test_vcard_3_parsing():
     card = read_one(get_test_file("simple_3_0_test.ics"))
     assert card.org.value == ["University of Novosibirsk", "Department of Octopus Parthenogenesis"]
 
-    for _ in range(3):
-        new_card = read_one(card.serialize())
-        assert new_card.org.value == card.org.value
-        card = new_card
+    # one round trip must preserve the value and reach a fixed point
+    serialized = card.serialize()
+    new_card = read_one(serialized)
+    assert new_card.org.value == card.org.value
+    assert new_card.serialize() == serialized
 
 
 def test_read_components(class_setup):
@@ -58,44 +82,59 @@ def test_read_components(class_setup):
     assert str(cal.vevent.summary) == "<SUMMARY{'BLAH': ['hi!']}Bastille Day Party>"
 
 
-def test_parse_line():
-    assert parse_line("BLAH:") == ("BLAH", [], "", None)
-    assert parse_line("RDATE:VALUE=DATE:19970304,19970504,19970704,19970904") == (
-        "RDATE",
-        [],
-        "VALUE=DATE:19970304,19970504,19970704,19970904",
-        None,
-    )
-    assert parse_line(
-        'DESCRIPTION;ALTREP="http://www.wiz.org":The Fall 98 Wild Wizards Conference - - Las Vegas, NV, USA'
-    ) == (
-        "DESCRIPTION",
-        [["ALTREP", "http://www.wiz.org"]],
-        "The Fall 98 Wild Wizards Conference - - Las Vegas, NV, USA",
-        None,
-    )
-    assert parse_line("EMAIL;PREF;INTERNET:john@nowhere.com") == (
-        "EMAIL",
-        [["PREF"], ["INTERNET"]],
-        "john@nowhere.com",
-        None,
-    )
-    assert parse_line('EMAIL;TYPE="blah",hah;INTERNET="DIGI",DERIDOO:john@nowhere.com') == (
-        "EMAIL",
-        [["TYPE", "blah", "hah"], ["INTERNET", "DIGI", "DERIDOO"]],
-        "john@nowhere.com",
-        None,
-    )
-    assert parse_line("item1.ADR;type=HOME;type=pref:;;Reeperbahn 116;Hamburg;;20359;") == (
-        "ADR",
-        [["type", "HOME"], ["type", "pref"]],
-        ";;Reeperbahn 116;Hamburg;;20359;",
-        "item1",
-    )
+def test_read_components_is_lazy():
+    components = read_components("BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\nBEGIN:VCALENDAR\r\n")
+    assert next(components).name == "VCALENDAR"
+    with pytest.raises(ParseError):
+        next(components)
+
+
+PARSE_LINE_CASES = (
+    ("BLAH:", ("BLAH", [], "", None)),
+    (
+        "RDATE:VALUE=DATE:19970304,19970504,19970704,19970904",
+        ("RDATE", [], "VALUE=DATE:19970304,19970504,19970704,19970904", None),
+    ),
+    (
+        'DESCRIPTION;ALTREP="http://www.wiz.org":The Fall 98 Wild Wizards Conference - - Las Vegas, NV, USA',
+        (
+            "DESCRIPTION",
+            [["ALTREP", "http://www.wiz.org"]],
+            "The Fall 98 Wild Wizards Conference - - Las Vegas, NV, USA",
+            None,
+        ),
+    ),
+    ("EMAIL;PREF;INTERNET:john@nowhere.com", ("EMAIL", [["PREF"], ["INTERNET"]], "john@nowhere.com", None)),
+    (
+        'EMAIL;TYPE="blah",hah;INTERNET="DIGI",DERIDOO:john@nowhere.com',
+        ("EMAIL", [["TYPE", "blah", "hah"], ["INTERNET", "DIGI", "DERIDOO"]], "john@nowhere.com", None),
+    ),
+    (
+        "item1.ADR;type=HOME;type=pref:;;Reeperbahn 116;Hamburg;;20359;",
+        ("ADR", [["type", "HOME"], ["type", "pref"]], ";;Reeperbahn 116;Hamburg;;20359;", "item1"),
+    ),
+)
+
+
+@pytest.mark.parametrize("line,expected", PARSE_LINE_CASES)
+def test_parse_line(line, expected):
+    assert parse_line(line) == expected
+
+
+def test_parse_line_error():
     with pytest.raises(ParseError):
         parse_line(":")
 
 
+def test_parse_error_pickle():
+    error = ParseError("Failed to parse line: x", inputs="x")
+    error.line_number = 3
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is ParseError
+    assert (restored.msg, restored.line_number, restored.inputs) == (error.msg, 3, "x")
+    assert str(restored) == "At line 3: Failed to parse line: x"
+
+
 def test_vtodo(class_setup):
     obj = read_one(class_setup["vtodo_file"])
     obj.vtodo.add("completed")
@@ -7,15 +7,28 @@ if sys.platform == "win32":
     from vobject.win32tz import Win32tz
 
 
+# pylint:disable = W0621
+@pytest.fixture(scope="module")
+def zones():
+    # pylint:disable=E0601,E0606
+    local = Win32tz("Central Standard Time")
+    return {
+        "local": local,
+        "oct1": dt.datetime(month=10, year=2004, day=1, tzinfo=local),
+        "dec1": dt.datetime(month=12, year=2004, day=1, tzinfo=local),
+        "braz": Win32tz("E. South America Standard Time"),
+    }
+
+
 @pytest.mark.skipif(sys.platform != "win32", reason="This is a windows-specific module")
 class TestWin32tz:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        # pylint:disable=E0601,E0606,W0201
-        self.local = Win32tz("Central Standard Time")
-        self.oct1 = dt.datetime(month=10, year=2004, day=1, tzinfo=self.local)
-        self.dec1 = dt.datetime(month=12, year=2004, day=1, tzinfo=self.local)
-        self.braz = Win32tz("E. South America Standard Time")
+    def setup(self, zones):
+        # pylint:disable=W0201
+        self.local = zones["local"]
+        self.oct1 = zones["oct1"]
+        self.dec1 = zones["dec1"]
+        self.braz = zones["braz"]
 
     # TODO: test case taken from doctest, need help.
     @pytest.mark.skip(reason="This test fails and needs debugging")
@@ -9,10 +9,19 @@ from .exceptions import NativeError, ParseError, VObjectError
 from .helper import Character as Char
 from .helper import byte_decoder, get_buffer, logger, split_by_size
 from .helper.converter import to_vname
-from .helper.imports_ import TextIO, contextlib, copy, re, sys
+from .helper.imports_ import TextIO, contextlib, copy, lru_cache, re, sys
 from .patterns import patterns
 
 
+@lru_cache(maxsize=None)
+def _class_property(cls, name):
+    """
+    Return the property called name on cls or None, looked up once per class.
+    """
+    prop = getattr(cls, name, None)
+    return prop if isinstance(prop, property) else None
+
+
 # --------------------------------- Main classes -------------------------------
 class VBase:
     """
@@ -108,7 +117,6 @@ class VBase:
         if self.is_native or not self.behavior or not self.behavior.has_native:
             return self
 
-        self_orig = copy.copy(self)
         try:
             return self.behavior.transform_to_native(self)
         except ParseError as e:
@@ -120,7 +128,7 @@ class VBase:
             # wrap errors in transformation in a ParseError
             msg = "In transform_to_native, unhandled exception on line {0}: {1}: {2}"
             msg = msg.format(e.line_number, sys.exc_info()[0], sys.exc_info()[1])
-            msg = f"{msg} ({str(self_orig)})"
+            msg = f"{msg} ({self!s})"
             raise ParseError(msg, e.line_number) from e
 
     def transform_from_native(self):
@@ -215,7 +223,8 @@ class ContentLine(VBase):
         """
         super().__init__(group, *args, **kwds)
 
-        self.name = name.upper()
+        # names repeat on almost every line, interning keeps a single copy of each
+        self.name = sys.intern(name.upper())
         self.encoded = encoded
         self.params = {}
         self.singletonparams = []
@@ -223,14 +232,16 @@ class ContentLine(VBase):
         self.line_number = line_number
         self.value: str | dt.date = value
 
-        def update_table(x):
+        for x in params:
             if len(x) == 1:
-                self.singletonparams += x
+                self.singletonparams.append(x[0])
             else:
-                paramlist = self.params.setdefault(x[0].upper(), [])
-                paramlist.extend(x[1:])
-
-        list(map(update_table, params))
+                key = sys.intern(x[0].upper())
+                paramlist = self.params.get(key)
+                if paramlist is None:
+                    self.params[key] = list(x[1:])
+                else:
+                    paramlist.extend(x[1:])
 
         qp = False
         if "ENCODING" in self.params and "QUOTED-PRINTABLE" in self.params["ENCODING"]:
@@ -259,12 +270,11 @@ class ContentLine(VBase):
     def copy(self, copyit):
         super().copy(copyit)
         self.name = copyit.name
-        self.value = copy.copy(copyit.value)
+        value = copyit.value
+        self.value = value[:] if type(value) is list else copy.copy(value)
         self.encoded = self.encoded
-        self.params = copy.copy(copyit.params)
-        for k, v in self.params.items():
-            self.params[k] = copy.copy(v)
-        self.singletonparams = copy.copy(copyit.singletonparams)
+        self.params = {k: v[:] for k, v in copyit.params.items()}
+        self.singletonparams = copyit.singletonparams[:]
         self.line_number = copyit.line_number
 
     def __eq__(self, other):
@@ -305,11 +315,11 @@ class ContentLine(VBase):
             else:
                 raise VObjectError("Parameter list set to a non-list")
         else:
-            prop = getattr(self.__class__, name, None)
-            if isinstance(prop, property):
-                prop.fset(self, value)
-            else:
+            prop = _class_property(type(self), name)
+            if prop is None:
                 object.__setattr__(self, name, value)
+            else:
+                prop.fset(self, value)
 
     def __delattr__(self, name):
         try:
@@ -349,29 +359,20 @@ class ContentLine(VBase):
                 print(pre + " " * tabwidth, k, self.params[k])
 
     def default_serialize(self, outbuf, line_length):
-        started_encoded = self.encoded
-        if self.behavior and not started_encoded:
+        # behaviors without their own encoding only toggle self.encoded, skip that round trip
+        transcode = not self.encoded and self.behavior is not None and self.behavior.has_encoding
+        if transcode:
             self.behavior.encode(self)
 
-        s = get_buffer()
-
-        if self.group is not None:
-            s.write(f"{self.group}.")
-        s.write(self.name.upper())
-        keys = sorted(self.params.keys())
-        for key in keys:
-            paramstr = ",".join(dquote_escape(p) for p in self.params[key])
-            try:
-                s.write(f";{key}={paramstr}")
-            except (UnicodeDecodeError, UnicodeEncodeError):
-                s.write(f";{key}={paramstr.encode('utf-8')}")
-        try:
-            s.write(f":{self.value}")
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            s.write(f":{self.value.encode('utf-8')}")
-        if self.behavior and not started_encoded:
+        parts = [self.name.upper()] if self.group is None else [f"{self.group}.", self.name.upper()]
+        params = self.params
+        if params:  # most lines have none, skip sorting an empty dict
+            for key in sorted(params):
+                parts.append(f";{key}={','.join([dquote_escape(p) for p in params[key]])}")
+        parts.append(f":{self.value}")
+        if transcode:
             self.behavior.decode(self)
-        fold_one_line(outbuf, s.getvalue(), line_length)
+        fold_one_line(outbuf, "".join(parts), line_length)
 
 
 class Component(VBase):
@@ -453,7 +454,7 @@ class Component(VBase):
             if name.endswith("_list"):
                 return self.contents[to_vname(name, 5)]
             else:
-                return self.contents[to_vname(name)][0]
+                return self.contents[to_vname(name) if "_" in name else name][0]
         except KeyError as e:
             raise AttributeError(name) from e
 
@@ -464,17 +465,17 @@ class Component(VBase):
         Underscores, legal in python variable names, are converted to dashes,
         which are legal in IANA tokens.
         """
-        prop = getattr(self.__class__, name, None)
-        if isinstance(prop, property):
-            prop.fset(self, value)
-        else:
+        prop = _class_property(type(self), name)
+        if prop is None:
             object.__setattr__(self, name, value)
+        else:
+            prop.fset(self, value)
 
     def get_child_value(self, child_name, default=None, child_number=0):
         """
         Return a child's value (the first, by default), or None.
         """
-        child = self.contents.get(to_vname(child_name))
+        child = self.contents.get(to_vname(child_name) if "_" in child_name else child_name)
         return default if child is None else child[child_number].value
 
     def add(self, obj_or_name, group=None):
@@ -568,7 +569,9 @@ class Component(VBase):
         for child_array in (self.contents[k] for k in self.sort_child_keys()):
             for child in child_array:
                 child = child.transform_to_native()
-                child.transform_children_to_native()
+                # content lines have no children, skip the no-op recursion
+                if isinstance(child, Component):
+                    child.transform_children_to_native()
 
     def transform_children_from_native(self, clear_behavior=True):
         """
@@ -605,9 +608,9 @@ class Component(VBase):
 
 class ComponentStack(Stack):
     def modify_top(self, item):
-        top = self.top()
-        if top:
-            top.add(item)
+        # called for every parsed line, so the list is read directly instead of via top()
+        if self.stack:
+            self.stack[-1].add(item)
         else:
             new = Component()
             self.push(new)
@@ -618,19 +621,20 @@ class ComponentStack(Stack):
 param_values_re = re.compile(patterns["param_value_grouped"], re.VERBOSE)
 params_re = re.compile(patterns["params_grouped"], re.VERBOSE)
 line_re = re.compile(patterns["line"], re.DOTALL | re.VERBOSE)
-begin_re = re.compile("BEGIN", re.IGNORECASE)
 
-wrap_re = re.compile(patterns["wraporend"], re.VERBOSE)
-logical_lines_re = re.compile(patterns["logicallines"], re.VERBOSE)
+line_end_re = re.compile(r"\r\n|\r|\n")
 
+# content line names read_components handles specially, everything else is a property
+_structural_names = frozenset(("VERSION", "BEGIN", "PROFILE", "END"))
 
-def parse_params(string):
+
+@lru_cache(1024)
+def _parse_params(string) -> tuple:
     """
-    Parse parameters
+    Parse parameters into tuples, cached as the same params repeat across lines
     """
-    _all = params_re.findall(string)
     all_parameters = []
-    for tup in _all:
+    for tup in params_re.findall(string):
         param_list = [tup[0]]  # tup looks like (name, values_string)
         for pair in param_values_re.findall(tup[1]):
             # pair looks like ('', value) or (value, '')
@@ -638,8 +642,15 @@ def parse_params(string):
                 param_list.append(pair[0])
             else:
                 param_list.append(pair[1])
-        all_parameters.append(param_list)
-    return all_parameters
+        all_parameters.append(tuple(param_list))
+    return tuple(all_parameters)
+
+
+def parse_params(string):
+    """
+    Parse parameters
+    """
+    return [list(param) for param in _parse_params(string)] if string else []
 
 
 def parse_line(line, line_number=None):
@@ -649,13 +660,9 @@ def parse_line(line, line_number=None):
     match = line_re.match(line)
     if match is None:
         raise ParseError(f"Failed to parse line: {line!s}", line_number)
+    name, params, value, group = match.group("name", "params", "value", "group")
     # Underscores are replaced with dash to work around Lotus Notes
-    return (
-        match.group("name").replace("_", "-"),
-        parse_params(match.group("params")),
-        match.group("value"),
-        match.group("group"),
-    )
+    return name.replace("_", "-"), parse_params(params), value, group
 
 
 def get_logical_lines(fp, allow_qp=True):
@@ -668,83 +675,95 @@ def get_logical_lines(fp, allow_qp=True):
     of the line.
 
     Quoted-printable data will be decoded in the Behavior decoding phase.
+
+    fp may be a stream, a string, or any iterable of physical lines, with or
+    without their line endings.
     """
+    crlf, space_or_tab = Char.CRLF, frozenset(Char.SPACEORTAB)
+    if isinstance(fp, str):
+        fp = get_buffer(fp)
+    elif not hasattr(fp, "read"):
+        fp = get_buffer(crlf.join(line.rstrip(crlf) for line in fp))
+
     if not allow_qp:
         val = fp.read(-1)
 
-        line_number = 1
-        for match in logical_lines_re.finditer(val):
-            line, n = wrap_re.subn("", match.group())
-            if line:
-                yield line, line_number
-            line_number += n
+        # split physical lines in C, then join each line with its folded continuations
+        logical_line, line_start_number = [], 1
+        for line_number, line in enumerate(line_end_re.split(val), 1):
+            if logical_line and line and line[0] in space_or_tab:
+                logical_line.append(line[1:])
+                continue
+            if logical_line and (text := "".join(logical_line)):
+                yield text, line_start_number
+            logical_line, line_start_number = [line], line_number
+        if logical_line and (text := "".join(logical_line)):
+            yield text, line_start_number
 
     else:
         quoted_printable = False
-        logical_line = get_buffer()
+        logical_line = []
         line_number = 0
         line_start_number = 0
-        while True:
-            line = fp.readline()
-            if line == "":
-                break
-            line = line.rstrip(Char.CRLF)
+        for line in fp:
+            line = line.rstrip(crlf)
             line_number += 1
 
             if line.rstrip() == "":
-                if logical_line.tell() > 0:
-                    yield logical_line.getvalue(), line_start_number
+                if logical_line:
+                    yield "".join(logical_line), line_start_number
                 line_start_number = line_number
-                logical_line = get_buffer()
+                logical_line = []
                 quoted_printable = False
                 continue
 
             if quoted_printable and allow_qp:
-                logical_line.write("\n")
+                logical_line.append("\n")
                 quoted_printable = False
-            elif line[0] in Char.SPACEORTAB:
+            elif line[0] in space_or_tab:
                 line = line[1:]
-            elif logical_line.tell() > 0:
-                yield logical_line.getvalue(), line_start_number
+            elif logical_line:
+                yield "".join(logical_line), line_start_number
                 line_start_number = line_number
-                logical_line = get_buffer()
-            else:
-                logical_line = get_buffer()
-            logical_line.write(line)
+                logical_line = []
+            logical_line.append(line)
 
             # vCard 2.1 allows parameters to be encoded without a parameter name
             # False positives are unlikely, but possible.
-            val = logical_line.getvalue()
-            if val[-1] == "=" and val.lower().find("quoted-printable") >= 0:
+            # Only a line ending in "=" can continue, so the buffer is scanned just then.
+            if line[-1] == "=" and "quoted-printable" in "".join(logical_line).lower():
                 quoted_printable = True
 
-        if logical_line.tell() > 0:
-            yield logical_line.getvalue(), line_start_number
+        if logical_line:
+            yield "".join(logical_line), line_start_number
 
 
 def text_line_to_content_line(text, n=None):
-    return ContentLine(*parse_line(text, n), **{"encoded": True, "line_number": n})
+    return ContentLine(*parse_line(text, n), encoded=True, line_number=n)
 
 
+@lru_cache(1024)
 def dquote_escape(param):
     """
     Return param, or "param" if ',' or ';' or ':' is in param.
+
+    Cached, parameter values mostly come from a small vocabulary.
     """
     if '"' in param:
         raise VObjectError("Double quotes aren't allowed in parameter values.")
-    for char in ",;:":  # sourcery skip # temp
-        if char in param:
-            return f'"{param}"'
-    return param
+    return f'"{param}"' if "," in param or ";" in param or ":" in param else param
 
 
 def fold_one_line(outbuf: TextIO, input_: str, line_length=75):
     """
     Folding line procedure that ensures multi-byte utf-8 sequences are not broken across lines
     """
-    chunks = split_by_size(input_, byte_size=line_length)
-    for chunk in chunks:
-        outbuf.write(chunk)
+    if len(input_) <= line_length and input_.isascii():
+        # most lines fit, no need to split them
+        outbuf.write(input_)
+    else:
+        for chunk in split_by_size(input_, byte_size=line_length):
+            outbuf.write(chunk)
     outbuf.write(Char.CRLF)
 
 
@@ -761,11 +780,15 @@ def default_serialize(obj, buf, line_length):
 def read_components(stream_or_string, validate=False, transform=True, ignore_unreadable=False, allow_qp=False):
     """
     Generate one Component at a time from a stream.
+
+    UTF-8 encoded bytes are accepted as well as text.
     """
 
     def raise_parse_error(msg):
         raise ParseError(msg, n, inputs=stream_or_string)
 
+    if isinstance(stream_or_string, (bytes, bytearray)):
+        stream_or_string = stream_or_string.decode("utf-8")
     stream = get_buffer(stream_or_string)
     stack = ComponentStack()
     n, version_line = 0, None
@@ -773,7 +796,8 @@ def read_components(stream_or_string, validate=False, transform=True, ignore_unr
     for line, n in get_logical_lines(stream, allow_qp):
         # 1. Get vline
         try:
-            vline = text_line_to_content_line(line, n)
+            # same as text_line_to_content_line, without the extra call per line
+            vline = ContentLine(*parse_line(line, n), encoded=True, line_number=n)
         except VObjectError as e:
             if ignore_unreadable:
                 logger.error(f"Skipped line: {e.line_number or '?'}, message: {str(e)}")
@@ -781,16 +805,19 @@ def read_components(stream_or_string, validate=False, transform=True, ignore_unr
             raise e
 
         # 2. Parse vline
-        if vline.name == "VERSION":
+        name = vline.name
+        if name not in _structural_names:
+            stack.modify_top(vline)  # not a START or END line
+        elif name == "VERSION":
             version_line = vline
             stack.modify_top(vline)
-        elif vline.name == "BEGIN":
+        elif name == "BEGIN":
             stack.push(Component(vline.value, group=vline.group))
-        elif vline.name == "PROFILE":
+        elif name == "PROFILE":
             if not stack.top():
                 stack.push(Component())
             stack.top().set_profile(vline.value)
-        elif vline.name == "END":
+        else:  # END
             if not stack:
                 raise raise_parse_error(f"Attempted to end the {vline.value} component but it was never opened")
             if vline.value.upper() != stack.top_name():
@@ -808,8 +835,6 @@ def read_components(stream_or_string, validate=False, transform=True, ignore_unr
                 yield component  # EXIT POINT
             else:
                 stack.modify_top(stack.pop())
-        else:
-            stack.modify_top(vline)  # not a START or END line
 
     if stack.top():
         if stack.top_name() is None:
@@ -847,13 +872,16 @@ def register_behavior(behavior, name=None, default=False, id_=None):
             __behavior_registry[name]["default_"] = behavior
     else:
         __behavior_registry[name] = {id_: behavior, "default_": behavior}
+    get_behavior.cache_clear()
 
 
+@lru_cache(maxsize=512)
 def get_behavior(name, id_=None):
     """
     Return a matching behavior if it exists, or None.
 
-    If id is None, return the default for name.
+    If id is None, return the default for name. Lookups are cached until the
+    next register_behavior call.
     """
     name = name.upper()
     if name in __behavior_registry:
@@ -43,6 +43,9 @@ class Behavior:
         The lower-case list of children which should come first when sorting.
     @cvar allow_group:
         Whether or not vCard style group prefixes are allowed.
+    @cvar has_encoding:
+        Set automatically, True if the class overrides encode or decode.
+        Otherwise encoding only toggles line.encoded and can be skipped.
     """
 
     name = ""
@@ -56,10 +59,18 @@ class Behavior:
     allow_group = False
     force_utc = False
     sort_first = []
+    has_encoding = False
 
     def __init__(self):
         raise VObjectError("Behavior subclasses are not meant to be instantiated")
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # staticmethod and plain-function overrides have no __func__
+        cls.has_encoding = getattr(cls.encode, "__func__", cls.encode) is not Behavior.encode.__func__ or (
+            getattr(cls.decode, "__func__", cls.decode) is not Behavior.decode.__func__
+        )
+
     @classmethod
     def validate(cls, obj, raise_exception=False, complain_unrecognized=False):
         """Check if the object satisfies this behavior's requirements.
@@ -11,12 +11,12 @@ class ContentDict(dict):
             raise VObjectError("Component list set to a non-list")
         else:
             value = [value]
-        object.__setattr__(self, to_vname(key), value)
+        object.__setattr__(self, to_vname(key) if "_" in key else key, value)
 
     def __delattr__(self, key):
         if key.endswith("_list"):
             key = key[:-5]
-        object.__delattr__(self, to_vname(key))
+        object.__delattr__(self, to_vname(key) if "_" in key else key)
 
 
 class Stack:
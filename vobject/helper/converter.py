@@ -32,7 +32,7 @@ def to_unicode(value: str | bytes):
     return value.decode() if isinstance(value, bytes) else value
 
 
-@lru_cache(32)
+@lru_cache(maxsize=None)
 def to_vname(name, strip_num=0, upper=False) -> str:
     """
     Turn a Python name into an iCalendar style name,
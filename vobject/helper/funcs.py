@@ -27,6 +27,16 @@ def indent_str(prefix: str = " ", *, level: int = 0, tabwidth: int = 3) -> str:
 
 
 def split_by_size(text: str, byte_size: int) -> Generator:
+    if text.isascii():
+        # one byte per character, so the text can be sliced without encoding
+        start, size, total_size = 0, byte_size, len(text)
+        while start < total_size - byte_size:
+            yield f"{text[start:start + size]}{Char.CRLF} "
+            start += size
+            size = byte_size - 1
+        yield text[start:]
+        return
+
     start = space_count = 0
     encoded = text.encode()
     total_size = len(encoded)
@@ -1541,7 +1541,8 @@ def time_to_string(date_or_date_time):
 
 
 def date_to_string(date):
-    return date.strftime("%Y%m%d")
+    # formatted by hand, faster than strftime and always pads the year to four digits
+    return f"{date.year:04d}{date.month:02d}{date.day:02d}"
 
 
 def datetime_to_string(date_time, convert_to_utc=False) -> str:
@@ -1551,7 +1552,10 @@ def datetime_to_string(date_time, convert_to_utc=False) -> str:
     if date_time.tzinfo and convert_to_utc:
         date_time = date_time.astimezone(utc)
 
-    datestr = date_time.strftime("%Y%m%dT%H%M%S")
+    datestr = (
+        f"{date_time.year:04d}{date_time.month:02d}{date_time.day:02d}"
+        f"T{date_time.hour:02d}{date_time.minute:02d}{date_time.second:02d}"
+    )
     if tzinfo_eq(date_time.tzinfo, utc):
         datestr += "Z"
     return datestr
@@ -59,20 +59,3 @@ patterns["line"] = (
 )
 
 ' "%(qsafe_char)s*" | %(safe_char)s* '  # what is this line?? - never assigned?
-
-
-# logical line regular expressions
-patterns["lineend"] = r"(?:\r\n|\r|\n|$)"
-patterns["wrap"] = rf"{patterns['lineend']!s} [\t ]"
-patterns["logicallines"] = (
-    r"""
-(
-   (?: [^\r\n] | {wrap!s} )*
-   {lineend!s}
-)
-""".format(
-        **patterns
-    )
-)
-
-patterns["wraporend"] = r"({wrap!s} | {lineend!s} )".format(**patterns)
@@ -1,6 +1,7 @@
 import datetime
 import struct
 import winreg  # noqa : available in py39-py311
+from functools import lru_cache
 from operator import itemgetter
 
 handle = winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE)
@@ -20,7 +21,8 @@ class Win32tz(datetime.tzinfo):
     """tzinfo class based on win32's timezones available in the registry."""
 
     def __init__(self, name):
-        self.data = Win32tzData(name)
+        # the local zone is read fresh, named zones only hit the registry once
+        self.data = _zone_data(name) if name else Win32tzData(name)
 
     def utcoffset(self, dt):
         minutes = self.data.dstoffset if self._isdst(dt) else self.data.stdoffset
@@ -48,6 +50,11 @@ class Win32tz(datetime.tzinfo):
         return f"<win32tz - {self.data.display!s}>"
 
 
+@lru_cache(maxsize=None)
+def _zone_data(name):
+    return Win32tzData(name)
+
+
 def pick_nth_weekday(year, month, dayofweek, hour, minute, whichweek):
     """dayofweek == 0 means Sunday, whichweek > 4 means last instance"""
     first = datetime.datetime(year=year, month=month, hour=hour, minute=minute, day=1)